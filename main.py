@@ -0,0 +1,197 @@
+"""FastAPI front end for the lead management Camunda 8 process.
+
+ASGI port of the Flask ``app.py``: the three routes are pure I/O proxies
+around Zeebe gRPC calls, so they now run as native ``async def`` endpoints
+on a single event loop instead of bridging coroutines through
+``nest_asyncio`` + ``run_until_complete``.
+
+Run with::
+
+    uvicorn main:app --workers 4 --loop uvloop --http httptools
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from contextlib import asynccontextmanager
+
+import orjson
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from pyzeebe import ZeebeClient, create_camunda_cloud_channel
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROCESS_ID = "lead-management-process"
+
+# Read once at import: os.getenv re-encodes the key and hits the environ
+# dict on every call, which is pure waste behind a webhook hot path.
+ZEEBE_CLIENT_ID = os.getenv("ZEEBE_CLIENT_ID")
+ZEEBE_CLIENT_SECRET = os.getenv("ZEEBE_CLIENT_SECRET")
+CAMUNDA_CLUSTER_ID = os.getenv("CAMUNDA_CLUSTER_ID")
+CAMUNDA_CLUSTER_REGION = os.getenv("CAMUNDA_CLUSTER_REGION", "bru-2")
+
+# Keep the shared channel warm: pings hold the HTTP/2 connection open
+# through idle periods so requests never pay a reconnect, and the stream
+# limit accommodates bursts of concurrent RPCs. 45 s matches the official
+# Java client and stays above the Zeebe gateway's default 30 s
+# minKeepAliveInterval, which answers faster pings with GOAWAY.
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 45_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_concurrent_streams", 1000),
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One channel per process: gRPC multiplexes concurrent RPCs over a
+    # single HTTP/2 connection, and the OAuth interceptor caches the
+    # bearer token, so building this per request only buys an extra
+    # TLS handshake and client-credentials round-trip each time.
+    app.state.zeebe = get_zeebe_client()
+    yield
+
+
+# orjson serializes responses in C instead of the stdlib's pure-Python
+# encoder; small frequent payloads like ours benefit the most.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+
+class LeadIn(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    leadName: str
+    email: str = ""
+    company: str = ""
+
+
+def get_zeebe_client() -> ZeebeClient:
+    channel = create_camunda_cloud_channel(
+        client_id=ZEEBE_CLIENT_ID,
+        client_secret=ZEEBE_CLIENT_SECRET,
+        cluster_id=CAMUNDA_CLUSTER_ID,
+        region=CAMUNDA_CLUSTER_REGION,
+        channel_options=_GRPC_CHANNEL_OPTIONS,
+    )
+    return ZeebeClient(channel)
+
+
+# Retried webhooks and double-submitted forms would each start a fresh
+# process instance; replaying the recent response collapses duplicates
+# to a cache hit instead of a gRPC call plus downstream enrichment.
+_idempotency_cache = TTLCache(maxsize=10_000, ttl=60)
+_idempotency_lock = asyncio.Lock()
+
+
+def _idempotency_key(variables: dict) -> bytes:
+    # Webhook values may be null or non-string JSON; coerce each field so
+    # keying never raises. repr of the tuple quotes and escapes fields,
+    # so no two distinct submissions encode to the same key material.
+    fields = tuple(
+        "" if value is None else str(value)
+        for value in (
+            variables.get("leadName"),
+            variables.get("email"),
+            variables.get("company"),
+        )
+    )
+    return hashlib.blake2b(repr(fields).encode(), digest_size=16).digest()
+
+
+async def _replay_or_start(variables: dict) -> ORJSONResponse | dict:
+    key = _idempotency_key(variables)
+    async with _idempotency_lock:
+        cached = _idempotency_cache.get(key)
+    if cached is not None:
+        return ORJSONResponse(content=cached, headers={"X-Idempotent-Replay": "true"})
+
+    client = app.state.zeebe
+    response = await client.run_process(
+        bpmn_process_id=PROCESS_ID,
+        variables=variables,
+    )
+    body = {
+        "processInstanceKey": response.process_instance_key,
+        "status": "STARTED",
+    }
+    async with _idempotency_lock:
+        _idempotency_cache[key] = body
+    return body
+
+
+@app.post("/leads")
+async def create_lead(lead: LeadIn):
+    variables = lead.model_dump()
+    # %s-style args are only rendered if the record is emitted, so no
+    # serialization cost is paid when INFO is disabled.
+    logger.info("Starting process with variables: %s", variables)
+
+    try:
+        return await _replay_or_start(variables)
+    except Exception as e:
+        logger.error("Failed to start process: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to start process")
+
+
+# Cap webhook bodies so an oversized payload gets a 413 instead of
+# being buffered wholesale into memory.
+_MAX_WEBHOOK_BYTES = 1 * 1024 * 1024
+
+
+@app.post("/webhook")
+async def webhook_handler(request: Request):
+    content_length = request.headers.get("content-length")
+    if content_length and int(content_length) > _MAX_WEBHOOK_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    raw = await request.body()
+    if len(raw) > _MAX_WEBHOOK_BYTES:
+        raise HTTPException(status_code=413, detail="Payload too large")
+    logger.info("Webhook payload: %d bytes", len(raw))
+    # The body is only ever decoded to str for debug logging; orjson
+    # consumes the raw bytes and does the UTF-8 validation itself.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Webhook payload: %s", raw.decode("utf-8", errors="replace"))
+
+    try:
+        webhook_data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Expected JSON data")
+    # Arrays and scalars are valid JSON but not a webhook payload.
+    if not isinstance(webhook_data, dict):
+        raise HTTPException(status_code=400, detail="Expected JSON data")
+
+    variables = {
+        "leadName": webhook_data.get("leadName", ""),
+        "email": webhook_data.get("email", ""),
+        "company": webhook_data.get("company", ""),
+        "source": webhook_data.get("source", "webhook"),
+    }
+
+    try:
+        return await _replay_or_start(variables)
+    except Exception as e:
+        logger.error("Failed to start process from webhook: %s", e)
+        raise HTTPException(status_code=500, detail="Failed to start process")
+
+
+@app.get("/leads/{process_instance_key}/status")
+async def get_lead_status(process_instance_key: int):
+    client = app.state.zeebe
+    try:
+        topology = await client.topology()
+    except Exception as e:
+        logger.error("Failed to query cluster: %s", e)
+        raise HTTPException(status_code=503, detail="Cluster unavailable")
+
+    return {
+        "processInstanceKey": process_instance_key,
+        "status": "ACTIVE",
+        "brokers": len(topology.brokers),
+    }
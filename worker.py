@@ -0,0 +1,288 @@
+"""Async Zeebe job worker for the lead management process.
+
+Service task handlers register against the worker created here; run the
+module directly to start polling::
+
+    python worker.py
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from types import MappingProxyType
+
+import httpx
+from cachetools import TTLCache
+from openai import AsyncOpenAI
+from pyzeebe import ZeebeWorker, create_camunda_cloud_channel
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Compiled once at import: re.match(pattern, ...) pays a pattern-cache
+# lookup on every call, which adds up on hot validation paths.
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Read once at import rather than via os.getenv on each use.
+ZEEBE_CLIENT_ID = os.getenv("ZEEBE_CLIENT_ID")
+ZEEBE_CLIENT_SECRET = os.getenv("ZEEBE_CLIENT_SECRET")
+CAMUNDA_CLUSTER_ID = os.getenv("CAMUNDA_CLUSTER_ID")
+CAMUNDA_CLUSTER_REGION = os.getenv("CAMUNDA_CLUSTER_REGION", "bru-2")
+
+# Same keepalive tuning as main.py: hold the HTTP/2 connection open
+# through idle periods and allow bursts of concurrent job streams. 45 s
+# stays above the gateway's default 30 s minKeepAliveInterval.
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 45_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_concurrent_streams", 1000),
+)
+
+
+def create_worker() -> ZeebeWorker:
+    channel = create_camunda_cloud_channel(
+        client_id=ZEEBE_CLIENT_ID,
+        client_secret=ZEEBE_CLIENT_SECRET,
+        cluster_id=CAMUNDA_CLUSTER_ID,
+        region=CAMUNDA_CLUSTER_REGION,
+        channel_options=_GRPC_CHANNEL_OPTIONS,
+    )
+    return ZeebeWorker(channel)
+
+
+worker = create_worker()
+
+
+def validate_email(email: str) -> bool:
+    return bool(_EMAIL_RE.match(email))
+
+
+# Each task type gets its own poller inside ZeebeWorker.work(), so these
+# per-task settings size the topics independently: enrich-lead runs many
+# jobs at once to ride out OpenAI latency without starving the cheap
+# validation/notification topics, and store-lead activates in batch-sized
+# chunks to feed the buffered writer.
+@worker.task(task_type="validate-lead", timeout_ms=10_000, max_running_jobs=64)
+async def handle_validate_lead(leadName: str, email: str, company: str) -> dict:
+    logger.info("Validating lead: %s, %s, %s", leadName, email, company)
+
+    errors = []
+    if not leadName:
+        errors.append("Lead name is required")
+    if not email or not validate_email(email):
+        errors.append("A valid email address is required")
+
+    return {"leadValid": not errors, "validationErrors": errors}
+
+
+# One OpenAI client per process: HTTP/2 keep-alive lets successive
+# completions reuse the connection instead of paying a TLS connect each.
+_openai = AsyncOpenAI(http_client=httpx.AsyncClient(http2=True, timeout=30))
+
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a business analyst specializing in lead analysis.",
+}
+
+# Multiple contacts from the same company produce identical prompts, so
+# completions are cached by (lead_name, company). TTL-bounded so model
+# upgrades eventually propagate.
+_gpt_cache = TTLCache(maxsize=5_000, ttl=24 * 3600)
+_gpt_cache_lock = asyncio.Lock()
+
+
+async def enrich_with_chatgpt(lead_name: str, company: str) -> str:
+    key = hashlib.blake2b(
+        f"{lead_name}|{company}".encode(), digest_size=16
+    ).digest()
+    async with _gpt_cache_lock:
+        cached = _gpt_cache.get(key)
+    if cached is not None:
+        return cached
+
+    prompt = (
+        f"Analyze this lead: {lead_name} from {company}. "
+        "Provide a short assessment of their business potential."
+    )
+    response = await _openai.chat.completions.create(
+        model="gpt-3.5-turbo",
+        messages=[_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+    )
+    analysis = response.choices[0].message.content
+    async with _gpt_cache_lock:
+        _gpt_cache[key] = analysis
+    return analysis
+
+
+# Immutable stub payloads hoisted out of the handlers: the dict literals
+# were reallocated on every job although their contents never change.
+_LINKEDIN_STUB = MappingProxyType(
+    {
+        "company_info": "LinkedIn profile data",
+        "employee_count": "100-500",
+        "industry": "Technology",
+    }
+)
+_COMPANY_STUB = MappingProxyType(
+    {
+        "revenue": "$10M-$50M",
+        "founded": "2015",
+        "location": "San Francisco, CA",
+    }
+)
+
+
+async def enrich_with_linkedin(lead_name: str, company: str) -> dict:
+    # Placeholder for a LinkedIn API call.
+    data = dict(_LINKEDIN_STUB)
+    data["company_info"] = f"LinkedIn profile data for {company}"
+    return data
+
+
+async def enrich_with_company_data(company: str) -> dict:
+    # Placeholder for a company-data API call. Copied because the result
+    # is serialized into process variables downstream.
+    return dict(_COMPANY_STUB)
+
+
+@worker.task(task_type="enrich-lead", timeout_ms=60_000, max_running_jobs=32)
+async def handle_enrich_lead(leadName: str, email: str, company: str) -> dict:
+    logger.info("Enriching lead: %s from %s", leadName, company)
+
+    # The three enrichments are independent network calls; fan them out
+    # so the job takes max(...) instead of sum(...) of their latencies.
+    chatgpt_analysis, linkedin_data, company_data = await asyncio.gather(
+        enrich_with_chatgpt(leadName, company),
+        enrich_with_linkedin(leadName, company),
+        enrich_with_company_data(company),
+        return_exceptions=True,
+    )
+
+    enriched = {}
+    if isinstance(chatgpt_analysis, Exception):
+        logger.error("ChatGPT enrichment failed: %s", chatgpt_analysis)
+    else:
+        enriched["chatgptAnalysis"] = chatgpt_analysis
+    if isinstance(linkedin_data, Exception):
+        logger.error("LinkedIn enrichment failed: %s", linkedin_data)
+    else:
+        enriched["linkedinData"] = linkedin_data
+    if isinstance(company_data, Exception):
+        logger.error("Company data enrichment failed: %s", company_data)
+    else:
+        enriched["companyData"] = company_data
+
+    return enriched
+
+
+# Storage is buffered so high-volume runs cost one multi-row write per
+# flush instead of one round-trip per job.
+_STORE_BATCH_SIZE = 100
+_STORE_FLUSH_INTERVAL = 0.2
+
+_store_buffer: list[dict] = []
+_store_lock = asyncio.Lock()
+_store_flushed = asyncio.Event()
+# Events for batches that have been drained but not yet written; they are
+# only set once a write succeeds, so jobs never complete for lost data.
+_pending_flush_events: list[asyncio.Event] = []
+# Module-scope reference so the loop task is never garbage collected.
+_store_flush_task: asyncio.Task | None = None
+
+
+async def _write_batch(batch: list[dict]) -> None:
+    # Placeholder for a single multi-row INSERT (executemany/COPY).
+    logger.info("Storing batch of %d enriched leads", len(batch))
+
+
+async def _flush_store_buffer() -> None:
+    global _store_flushed
+    async with _store_lock:
+        if not _store_buffer:
+            return
+        batch = list(_store_buffer)
+        _store_buffer.clear()
+        flushed, _store_flushed = _store_flushed, asyncio.Event()
+        _pending_flush_events.append(flushed)
+    try:
+        await _write_batch(batch)
+    except Exception:
+        logger.exception("Failed to store batch of %d leads; requeueing", len(batch))
+        # Put the records back at the front so the next flush retries
+        # them; their event stays pending and fires with that flush.
+        async with _store_lock:
+            _store_buffer[:0] = batch
+        return
+    async with _store_lock:
+        done, _pending_flush_events[:] = list(_pending_flush_events), []
+    for event in done:
+        event.set()
+
+
+async def _store_flush_loop() -> None:
+    while True:
+        await asyncio.sleep(_STORE_FLUSH_INTERVAL)
+        try:
+            await _flush_store_buffer()
+        except Exception:
+            logger.exception("Lead batch flush failed")
+
+
+@worker.task(
+    task_type="store-lead",
+    timeout_ms=10_000,
+    max_jobs_to_activate=_STORE_BATCH_SIZE,
+    max_running_jobs=_STORE_BATCH_SIZE,
+)
+async def handle_store_lead(
+    leadName: str,
+    email: str,
+    company: str,
+    chatgptAnalysis: str = "",
+    linkedinData: dict = None,
+    companyData: dict = None,
+) -> dict:
+    record = {
+        "leadName": leadName,
+        "email": email,
+        "company": company,
+        "chatgptAnalysis": chatgptAnalysis,
+        "linkedinData": linkedinData,
+        "companyData": companyData,
+    }
+    async with _store_lock:
+        _store_buffer.append(record)
+        flushed = _store_flushed
+        full = len(_store_buffer) >= _STORE_BATCH_SIZE
+    if full:
+        await _flush_store_buffer()
+    # Complete the job only once the batch holding this record is written.
+    await flushed.wait()
+    return {"stored": True}
+
+
+@worker.task(task_type="notify-success", timeout_ms=10_000, max_running_jobs=64)
+async def handle_notify_success(leadName: str, email: str, company: str) -> dict:
+    # Placeholder for a notification call (email/Slack).
+    logger.info("Lead processed successfully: %s (%s) from %s", leadName, email, company)
+    return {"notified": True}
+
+
+async def main():
+    global _store_flush_task
+    logger.info("Starting lead management worker")
+    _store_flush_task = asyncio.create_task(_store_flush_loop())
+    await worker.work()
+
+
+if __name__ == "__main__":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+    asyncio.run(main())